@@ -0,0 +1,60 @@
+from __future__ import print_function
+
+import argparse
+import os
+import subprocess
+import sys
+
+CUR_DIR = os.path.dirname(os.path.realpath(__file__))
+
+# Modules the cron entry points should import before they know there is work to do
+TARGETS = ['nhc', 'fetch_active', 'fetch_closed']
+
+# Modules that must only be loaded once there is something to parse
+HEAVY_MODULES = ['BeautifulSoup', 'bs4', 'dateutil', 'json', 'parser', 'pytz', 'requests', 'xml.etree']
+
+# Run `python -X importtime -c "import <target>"` and return a dict of
+# module name -> cumulative import time in microseconds. The -X importtime
+# flag needs a Python 3.7+ interpreter.
+def measure(python, target):
+    command = [python, '-X', 'importtime', '-c', 'import %s' % target]
+    process = subprocess.Popen(command, cwd=CUR_DIR, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    stdout, stderr = process.communicate()
+
+    if process.returncode != 0:
+        sys.exit("Could not import %s:\n%s" % (target, stderr.decode('utf-8', 'replace')))
+
+    timings = {}
+    for line in stderr.decode('utf-8', 'replace').splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        timings[name.strip()] = int(cumulative_us)
+    return timings
+
+def is_heavy(module_name):
+    return any(module_name == m or module_name.startswith(m + '.') for m in HEAVY_MODULES)
+
+if __name__ == "__main__":
+
+    arg_parser = argparse.ArgumentParser(description='Measure import time of the command line entry points')
+    arg_parser.add_argument('--python', default=sys.executable, help='interpreter to benchmark (default: %(default)s)')
+    arg_parser.add_argument('--repeat', type=int, default=5, help='runs per target, the best is reported (default: %(default)s)')
+    args = arg_parser.parse_args()
+
+    failed = False
+
+    for target in TARGETS:
+
+        # Keep the fastest run to cut down on noise from the rest of the machine
+        runs = [measure(args.python, target) for i in range(args.repeat)]
+        best = min(runs, key=lambda t: t[target])
+        heavy = sorted(name for name in best if is_heavy(name))
+
+        print('%-14s %8.1f ms  (%d modules)' % (target, best[target] / 1000.0, len(best)))
+        if heavy:
+            failed = True
+            print('    heavy modules imported eagerly: %s' % ', '.join(heavy))
+
+    if failed:
+        sys.exit(1)
@@ -1,27 +1,46 @@
-import datetime
-import dateutil.parser
-import json
+import hashlib
 import os
-import pytz
-import re
-import requests
-import sys
-import urlparse
-import xml.etree.ElementTree
-
-from parser import Parser
 
 CUR_DIR = os.path.dirname(os.path.realpath(__file__))
 
-if __name__ == "__main__":
+ACTIVE_URL = 'http://www.nhc.noaa.gov/gis/kml/nhc_active.kml'
+STATE_PATH = os.path.join(CUR_DIR, 'nhc_active.md5')
+
+# Download the active storms KML and return it with its digest. If the feed has not
+# changed since the last successful run, the contents come back as None so the caller
+# can stop before importing any of the parse and serialize machinery.
+def fetch_active_kml(url=ACTIVE_URL, state_path=STATE_PATH, force=False):
+    import urllib2
+
+    kml_contents = urllib2.urlopen(url).read()
+    digest = hashlib.md5(kml_contents).hexdigest()
+
+    if not force and os.path.exists(state_path):
+        with open(state_path) as f:
+            if f.read().strip() == digest:
+                return None, digest
+
+    return kml_contents, digest
+
+def main(force=False):
+
+    # Check the main feed before loading anything heavy
+    kml_contents, digest = fetch_active_kml(force=force)
+    if kml_contents is None:
+        return
+
+    import dateutil.parser
+    import json
+    import requests
+    import xml.etree.ElementTree
+
+    from parser import Parser
 
     parser = Parser()
 
     # Parse the XML
-    url = 'http://www.nhc.noaa.gov/gis/kml/nhc_active.kml'
-    parser.log("Requesting Main URL: %s" % url)
-    request = requests.get(url)
-    root = xml.etree.ElementTree.fromstring(request.text)
+    parser.log("Requested Main URL: %s" % ACTIVE_URL)
+    root = xml.etree.ElementTree.fromstring(kml_contents)
 
     # Find the Folder elements in the XML. These are going to contain storm data
     # and storm forecasts. (Also wind speeds, but we ignore this)
@@ -245,5 +264,12 @@ if __name__ == "__main__":
         with open(filepath, 'w') as f:
             f.write(json.dumps(output, indent=4))
 
+    # Remember what we parsed so an unchanged feed can be skipped next time
+    with open(STATE_PATH, 'w') as f:
+        f.write(digest)
+
     # Note that we are finished
-    parser.log("-- Finished Parsing Run --")
\ No newline at end of file
+    parser.log("-- Finished Parsing Run --")
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,26 @@
-import BeautifulSoup
-import json
+import datetime
 import os
-import pytz
-import requests
-import sys
-import xml.etree.ElementTree
-
-from parser import Parser
 
 CUR_DIR = os.path.dirname(os.path.realpath(__file__))
 
-if __name__ == "__main__":
-    
+LIST_URL = "http://www.nhc.noaa.gov/gis/archive_besttrack_results.php?year=%d"
+
+def main(year):
+
+    import BeautifulSoup
+    import json
+    import pytz
+    import requests
+    import sys
+    import xml.etree.ElementTree
+
+    from parser import Parser
+
     # Instantiate our parser
     parser = Parser()
     
     # This is the main page that lists all the closed storms
-    list_url = "http://www.nhc.noaa.gov/gis/archive_besttrack_results.php?year=2014"
+    list_url = LIST_URL % year
     request = requests.get(list_url)
     html_contents = request.text
 
@@ -32,7 +36,7 @@ if __name__ == "__main__":
     # Request each kmz file and extract the KML
     for storm_url in kmz_links:
 
-        print 'Requesting URL: %s' % storm_url
+        print('Requesting URL: %s' % storm_url)
         request = requests.get(storm_url)
         kml_contents = parser.extract_kml_from_kmz_file_contents(request.content)
 
@@ -86,11 +90,14 @@ if __name__ == "__main__":
         }
     
         filename = '%s.geojson' % (storm_id.lower().replace(" ", "_"))
-        print 'Creating File: %s' % filename
+        print('Creating File: %s' % filename)
         
         # Write out file
         filepath = os.path.join(CUR_DIR, 'output/%s' % filename)
         with open(filepath, 'w') as f:
             f.write(json.dumps(output, indent=4))
 
-    print "Done."
\ No newline at end of file
+    print("Done.")
+
+if __name__ == "__main__":
+    main(datetime.date.today().year)
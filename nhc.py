@@ -0,0 +1,49 @@
+import argparse
+import datetime
+
+# Each subcommand imports its fetch module only when it runs, and the fetch modules
+# in turn defer requests, dateutil, pytz, BeautifulSoup and the parser until they
+# actually have something to parse. Keep the imports above this line cheap.
+
+def run_active(args):
+    import fetch_active
+    fetch_active.main(force=args.force)
+
+def run_closed(args):
+    import fetch_closed
+    fetch_closed.main(args.year)
+
+def run_backfill(args):
+    import fetch_closed
+    for year in range(args.start_year, args.end_year + 1):
+        fetch_closed.main(year)
+
+def build_arg_parser():
+
+    this_year = datetime.date.today().year
+
+    arg_parser = argparse.ArgumentParser(description="Fetch and parse the National Hurricane Center's KML feed into geojson")
+    subparsers = arg_parser.add_subparsers(dest='command')
+    subparsers.required = True
+
+    active = subparsers.add_parser('active', help='fetch the currently active storms')
+    active.add_argument('--force', action='store_true', help='parse the feed even if it has not changed since the last run')
+    active.set_defaults(func=run_active)
+
+    closed = subparsers.add_parser('closed', help="fetch a season's past storms")
+    closed.add_argument('--year', type=int, default=this_year, help='season to fetch (default: %(default)s)')
+    closed.set_defaults(func=run_closed)
+
+    backfill = subparsers.add_parser('backfill', help='fetch the past storms for a range of seasons')
+    backfill.add_argument('start_year', type=int)
+    backfill.add_argument('end_year', type=int, nargs='?', default=this_year)
+    backfill.set_defaults(func=run_backfill)
+
+    return arg_parser
+
+def main(argv=None):
+    args = build_arg_parser().parse_args(argv)
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,4 @@
 import datetime
-import dateutil.parser
 import pytz
 import StringIO
 import xml.etree.ElementTree